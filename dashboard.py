@@ -15,10 +15,27 @@ import random
 import time
 import argparse
 import socket
-from dataclasses import dataclass, asdict
+import selectors
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, fields
 
+import numpy as np
 import pygame
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; without it the kernels run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; stdlib json also accepts bytes
+    json_loads = json.loads
+
 # -----------------------------
 # Utility & Theme
 # -----------------------------
@@ -44,7 +61,7 @@ def lerp(a, b, t):
 # Sensor Model & Simulator
 # -----------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Sensors:
     speed_kmh: float = 0.0            # 0..260
     rpm: float = 800.0                # 0..8000
@@ -62,99 +79,160 @@ class Sensors:
     lights_low: bool = False
     lights_high: bool = False
 
+SENSOR_FIELDS = tuple(f.name for f in fields(Sensors))
+
+# Numeric fields kept in Dashboard.history, one column each (see HISTORY_COLUMN)
+HISTORY_FIELDS = ("speed_kmh", "rpm", "fuel_level", "coolant_temp_c", "oil_temp_c",
+                  "oil_pressure_bar", "turbo_bar", "batt_v", "lambda_value")
+HISTORY_COLUMN = {name: i for i, name in enumerate(HISTORY_FIELDS)}
+HISTORY_LEN = 3600  # 1 min at 60 fps
+
+@njit(cache=True, fastmath=True)
+def _sim_step(t, noise_speed, noise_rpm):
+    """Simulated sensor values at time t, in Sensors field order."""
+    speed = 120 * (0.5 + 0.5 * math.sin(t * 0.35))
+    speed = max(0.0, min(240.0, speed + noise_speed))
+
+    rpm = 1000 + 3500 * (0.5 + 0.5 * math.sin(t * 0.9))
+    rpm = max(650.0, min(7800.0, rpm + noise_rpm))
+
+    fuel = 0.7 - (t * 0.0005)
+    fuel = (fuel % 1.0) if fuel < 0 else max(0.02, min(0.98, fuel))
+
+    coolant = max(10.0, min(120.0, 70 + 20 * (0.5 + 0.5 * math.sin(t * 0.2))))
+    oil_temp = max(60.0, min(130.0, 85 + 25 * (0.5 + 0.5 * math.sin(t * 0.17 + 1.2))))
+
+    oil_press = max(0.4, min(6.8, 1.0 + (rpm / 8000.0) * 5.5 + 0.1 * math.sin(t * 1.7)))
+    turbo = max(-0.9, min(2.8, -0.2 + (rpm / 8000.0) * 2.5 + 0.1 * math.sin(t * 0.7)))
+
+    batt = max(9.0, min(16.0, 13.4 + 0.4 * math.sin(t * 0.3)))
+    lam = max(0.6, min(3.0, 0.95 + 0.15 * math.sin(t * 1.3)))
+
+    blink = (math.sin(t * math.tau * 0.8) > 0.0)
+    left = blink
+    right = not blink
+
+    lights_parking = (math.sin(t * 0.15) > 0.6)
+    lights_low = (math.sin(t * 0.09 + 1.1) > 0.2)
+    lights_high = (math.sin(t * 0.12 - 0.5) > 0.8)
+    handbrake = (math.sin(t * 0.07) > 0.95)
+
+    return (speed, rpm, fuel, coolant, oil_temp, oil_press, turbo, batt, lam,
+            left, right, handbrake, lights_parking, lights_low, lights_high)
+
 class SensorSimulator:
     def __init__(self):
         self.t0 = time.perf_counter()
+        self._cur = Sensors()
 
     def update(self) -> Sensors:
+        """Advance the simulation. The same Sensors instance is updated and returned every call."""
         t = time.perf_counter() - self.t0
-        speed = 120 * (0.5 + 0.5 * math.sin(t * 0.35))
-        speed = clamp(speed + random.uniform(-1.2, 1.2), 0, 240)
-
-        rpm = 1000 + 3500 * (0.5 + 0.5 * math.sin(t * 0.9))
-        rpm = clamp(rpm + random.uniform(-50, 50), 650, 7800)
-
-        fuel = 0.7 - (t * 0.0005)
-        fuel = (fuel % 1.0) if fuel < 0 else clamp(fuel, 0.02, 0.98)
-
-        coolant = clamp(70 + 20 * (0.5 + 0.5 * math.sin(t * 0.2)), 10, 120)
-        oil_temp = clamp(85 + 25 * (0.5 + 0.5 * math.sin(t * 0.17 + 1.2)), 60, 130)
-
-        oil_press = clamp(1.0 + (rpm / 8000.0) * 5.5 + 0.1 * math.sin(t * 1.7), 0.4, 6.8)
-        turbo = clamp(-0.2 + (rpm / 8000.0) * 2.5 + 0.1 * math.sin(t * 0.7), -0.9, 2.8)
-
-        batt = clamp(13.4 + 0.4 * math.sin(t * 0.3), 9, 16)
-        lam = clamp(0.95 + 0.15 * math.sin(t * 1.3), 0.6, 3.0)
-
-        blink = (math.sin(t * math.tau * 0.8) > 0.0)
-        left = blink
-        right = not blink
-
-        lights_parking = (math.sin(t * 0.15) > 0.6)
-        lights_low = (math.sin(t * 0.09 + 1.1) > 0.2)
-        lights_high = (math.sin(t * 0.12 - 0.5) > 0.8)
-        handbrake = (math.sin(t * 0.07) > 0.95)
-
-        return Sensors(
-            speed_kmh=speed, rpm=rpm, fuel_level=fuel,
-            coolant_temp_c=coolant, oil_temp_c=oil_temp,
-            oil_pressure_bar=oil_press, turbo_bar=turbo,
-            batt_v=batt, lambda_value=lam,
-            left_blinker=left, right_blinker=right,
-            handbrake=handbrake,
-            lights_parking=lights_parking,
-            lights_low=lights_low, lights_high=lights_high
-        )
+        c = self._cur
+        (c.speed_kmh, c.rpm, c.fuel_level, c.coolant_temp_c, c.oil_temp_c,
+         c.oil_pressure_bar, c.turbo_bar, c.batt_v, c.lambda_value,
+         c.left_blinker, c.right_blinker, c.handbrake,
+         c.lights_parking, c.lights_low, c.lights_high) = _sim_step(t, random.uniform(-1.2, 1.2), random.uniform(-50, 50))
+        return c
 
 # -----------------------------
 # UDP Sensor Receiver (optional)
 # -----------------------------
 
 class UdpReceiver:
+    """Receives sensor JSON on a background thread; poll() just returns the newest packet."""
+
     def __init__(self, host="0.0.0.0", port=5005):
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.sock.setblocking(False)
         self.sock.bind((host, port))
         self.last = None
+        # datagrams are read into one reusable buffer; only the newest is copied out and parsed
+        self._buf = bytearray(8192)
+        self._view = memoryview(self._buf)
+        self._sel = selectors.DefaultSelector()
+        self._sel.register(self.sock, selectors.EVENT_READ)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="udp-receiver", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            if not self._sel.select(timeout=0.1):
+                continue
+            # drain everything queued and only parse the newest datagram
+            n = 0
+            while True:
+                try:
+                    n = self.sock.recv_into(self._buf)
+                except (BlockingIOError, OSError):
+                    break
+            if not n:
+                continue
+            try:
+                self.last = json_loads(bytes(self._view[:n]))  # single reference swap, atomic under the GIL
+            except Exception:
+                pass
 
     def poll(self):
-        try:
-            data, _ = self.sock.recvfrom(8192)
-            obj = json.loads(data.decode("utf-8"))
-            self.last = obj
-        except BlockingIOError:
-            pass
-        except Exception:
-            pass
         return self.last
 
+    def close(self):
+        self._stop.set()
+        self._thread.join()
+        self._sel.close()
+        self.sock.close()
+
 def sensors_from_dict(obj: dict, fallback: Sensors) -> Sensors:
-    d = asdict(fallback)
-    for k in d.keys():
+    """Overwrite fallback, in place, with the fields present in obj and return it."""
+    for k in SENSOR_FIELDS:
         if k in obj:
-            d[k] = obj[k]
-    return Sensors(**d)
+            setattr(fallback, k, obj[k])
+    return fallback
 
 # -----------------------------
 # Drawing primitives
 # -----------------------------
 
+# LRU of rendered text: (font, text, color) -> Surface. Labels are static and
+# values (km/h, gauge readouts) cycle through a small set, so font.render is
+# rarely hit after warm-up. Keyed on the font itself so ids can't be reused.
+_TEXT_CACHE = OrderedDict()
+_TEXT_CACHE_MAX = 512
+
+def display_format(surf):
+    """convert_alpha() to the display format so blits take SDL's fast path.
+    With --renderer there is no display surface and surf is returned as is."""
+    return surf.convert_alpha() if pygame.display.get_surface() else surf
+
+def render_text(text, font, color):
+    key = (font, text, color)
+    tx = _TEXT_CACHE.get(key)
+    if tx is None:
+        tx = display_format(font.render(text, True, color))
+        _TEXT_CACHE[key] = tx
+        if len(_TEXT_CACHE) > _TEXT_CACHE_MAX:
+            _TEXT_CACHE.popitem(last=False)
+    else:
+        _TEXT_CACHE.move_to_end(key)
+    return tx
+
 def draw_text(surf, text, font, color, pos, align="center"):
-    tx = font.render(text, True, color)
-    r = tx.get_rect()
+    tx = render_text(text, font, color)
+    # same placement as assigning pos to tx.get_rect().<align>, without building the Rect
+    w, h = tx.get_size()
+    x, y = pos
     if align == "center":
-        r.center = pos
-    elif align == "topleft":
-        r.topleft = pos
+        x -= w // 2
+        y -= h // 2
     elif align == "topright":
-        r.topright = pos
+        x -= w
     elif align == "midleft":
-        r.midleft = pos
+        y -= h // 2
     elif align == "midright":
-        r.midright = pos
-    else:
-        r.topleft = pos
-    surf.blit(tx, r)
+        x -= w
+        y -= h // 2
+    surf.blit(tx, (x, y))
 
 def draw_roundrect(surface, rect, color, radius=12, width=0):
     x, y, w, h = rect
@@ -173,23 +251,44 @@ def polar(center, radius, angle_deg):
     ang = math.radians(angle_deg)
     return (center[0] + radius * math.cos(ang), center[1] + radius * math.sin(ang))
 
-def draw_tick_circle(surf, center, radius, amin, amax, step_deg, color=(60,70,80), thick=2, major_every=3):
-    tick = 0
-    a = amin
-    while a <= amax + 0.001:
-        inner = radius - (10 if (tick % major_every) else 16)
-        outer = radius
-        p1 = polar(center, inner, a)
-        p2 = polar(center, outer, a)
-        pygame.draw.line(surf, color, p1, p2, thick if (tick % major_every) else max(thick+1, 3))
-        tick += 1
-        a += step_deg
-
-def draw_pointer(surf, center, angle_deg, length, color=FG, width=4):
-    tip = polar(center, length, angle_deg)
+def tick_lines(center, radius, amin, amax, step_deg, thick=2, major_every=3):
+    """Endpoints of a tick ring as a list of (p1, p2, width); every major_every-th tick is major."""
+    ang = np.deg2rad(np.arange(amin, amax + 0.001, step_deg))
+    major = (np.arange(len(ang)) % major_every) == 0
+    inner = np.where(major, radius - 16, radius - 10)
+    cos, sin = np.cos(ang), np.sin(ang)
+    x1, y1 = center[0] + inner * cos, center[1] + inner * sin
+    x2, y2 = center[0] + radius * cos, center[1] + radius * sin
+    widths = np.where(major, max(thick+1, 3), thick)
+    return [((a, b), (c, d), w) for a, b, c, d, w in
+            zip(x1.tolist(), y1.tolist(), x2.tolist(), y2.tolist(), widths.tolist())]
+
+def draw_tick_circle(surf, lines, color=(60,70,80)):
+    for p1, p2, width in lines:
+        pygame.draw.line(surf, color, p1, p2, width)
+
+def draw_pointer(surf, center, tip, color=FG, width=4):
     pygame.draw.line(surf, color, center, tip, width)
     pygame.draw.circle(surf, color, center, width+1, 0)
 
+_NEEDLE_CACHE = {}
+
+def needle_sprite(length, angle_deg, color=FG, width=5):
+    """draw_pointer() needle rotated to angle_deg (whole degrees) and cropped, plus the
+    offset of its top-left corner from the pivot. Shared by gauges with the same needle."""
+    key = (length, angle_deg, color, width)
+    hit = _NEEDLE_CACHE.get(key)
+    if hit is None:
+        pad = width + 2
+        base = pygame.Surface((2 * (length + pad), 2 * pad), pygame.SRCALPHA)
+        draw_pointer(base, (length + pad, pad), (2 * length + pad, pad), color, width)
+        rot = pygame.transform.rotozoom(base, -angle_deg, 1.0)
+        crop = rot.get_bounding_rect()
+        hit = (display_format(rot.subsurface(crop).copy()),
+               (crop.x - rot.get_width() // 2, crop.y - rot.get_height() // 2))
+        _NEEDLE_CACHE[key] = hit
+    return hit
+
 def draw_arc_section(surf, rect, start_deg, end_deg, color, width=8):
     pygame.draw.arc(surf, color, rect, math.radians(start_deg), math.radians(end_deg), width)
 
@@ -203,6 +302,7 @@ class LinearBar:
         self.vmin = vmin
         self.vmax = vmax
         self.zones = zones  # list of (until_value, color)
+        self._px_per_unit = self.rect.h / (vmax - vmin)
 
     def draw_bg(self, surf):
         x, y, w, h = self.rect
@@ -218,26 +318,42 @@ class LinearBar:
             last_val = val
         pygame.draw.rect(surf, (30, 32, 38), self.rect, width=3, border_radius=12)
 
+    def level(self, value):
+        """Bar height in pixels for value."""
+        # clamp() inlined: this runs every frame
+        return int((max(self.vmin, min(self.vmax, value)) - self.vmin) * self._px_per_unit)
+
     def draw_value(self, surf, value):
+        self.draw_level(surf, self.level(value))
+
+    def draw_level(self, surf, level_h):
         x, y, w, h = self.rect
-        level_h = int((clamp(value, self.vmin, self.vmax) - self.vmin) / (self.vmax - self.vmin) * h)
         level_rect = pygame.Rect(x+6, y + h - level_h + 6, w-12, level_h-12)
         draw_roundrect(surf, level_rect, (255, 255, 255, 20), radius=8, width=0)
 
 class VerticalFuel:
     def __init__(self, rect):
         self.rect = pygame.Rect(rect)
+        self.inner = self.rect.inflate(-10, -10)
 
-    def draw(self, surf, fuel_level):
-        x, y, w, h = self.rect
+    def draw_bg(self, surf):
+        inner = self.inner
         pygame.draw.rect(surf, DARK, self.rect, border_radius=12)
-        inner = self.rect.inflate(-10, -10)
         reserve_y = inner.bottom - int(0.12 * inner.height)
         pygame.draw.rect(surf, ORANGE, (inner.left, reserve_y-3, inner.width, 6), border_radius=2)
-        level_h = int(clamp(fuel_level, 0, 1) * inner.height)
+        pygame.draw.rect(surf, (30, 32, 38), self.rect, width=3, border_radius=12)
+
+    def level(self, fuel_level):
+        """Fuel column height in pixels."""
+        return int(max(0, min(1, fuel_level)) * self.inner.height)
+
+    def draw_value(self, surf, fuel_level):
+        self.draw_level(surf, self.level(fuel_level))
+
+    def draw_level(self, surf, level_h):
+        inner = self.inner
         level_rect = pygame.Rect(inner.left, inner.bottom - level_h, inner.width, level_h)
         pygame.draw.rect(surf, CYAN, level_rect, border_radius=6)
-        pygame.draw.rect(surf, (30, 32, 38), self.rect, width=3, border_radius=12)
 
 class RadialGauge:
     def __init__(self, center, radius, vmin, vmax, amin=-210, amax=30, label="", unit="", arc_zones=None):
@@ -250,22 +366,46 @@ class RadialGauge:
         self.label = label
         self.unit = unit
         self.arc_zones = arc_zones or []  # list of (from_value, to_value, color)
+        self.rect = pygame.Rect(0, 0, radius*2, radius*2)
+        self.rect.center = center
+        self._tick_lines = tick_lines(center, radius, amin, amax, step_deg=12)
+        self._value_pos = (center[0], int(center[1] + radius * 0.78 + 0.5))
+        self._arc_rect = self.rect.inflate(-16, -16)
+        self._arc_specs = [(math.radians(angle_for_value(v0, vmin, vmax, amin, amax)),
+                            math.radians(angle_for_value(v1, vmin, vmax, amin, amax)), color)
+                           for v0, v1, color in self.arc_zones]
+        # the needle is blitted from sprites pre-rotated to every whole degree of the sweep
+        self._needle_len = radius - 18
+        self._deg_scale = (amax - amin) / (vmax - vmin) if vmax != vmin else 0.0
+        for deg in range(min(amin, amax), max(amin, amax) + 1):
+            needle_sprite(self._needle_len, deg)
+
+    def draw_static(self, surf, fonts):
+        """Ticks, colored zones and label: everything that doesn't depend on the value."""
+        draw_tick_circle(surf, self._tick_lines, color=(60,70,80))
+        for a0, a1, color in self._arc_specs:
+            pygame.draw.arc(surf, color, self._arc_rect, a0, a1, 10)
+        draw_text(surf, self.label, fonts['small'], MUTED, (self.center[0], self.center[1] + self.radius * 0.55))
+
+    def state(self, value):
+        """(needle angle in whole degrees, readout text): two values with equal state draw identically."""
+        deg = round(self.amin + (max(self.vmin, min(self.vmax, value)) - self.vmin) * self._deg_scale)
+        val_str = f"{value:.1f}{self.unit}" if self.unit else f"{int(value)}"
+        return deg, val_str
+
+    def draw_dynamic(self, surf, fonts, value):
+        """Pointer and numeric readout."""
+        self.draw_state(surf, fonts, self.state(value))
+
+    def draw_state(self, surf, fonts, state):
+        deg, val_str = state
+        img, (ox, oy) = needle_sprite(self._needle_len, deg)
+        surf.blit(img, (self.center[0] + ox, self.center[1] + oy))
+        draw_text(surf, val_str, fonts['small'], FG, self._value_pos)
 
     def draw(self, surf, fonts, value):
-        small = fonts['small']
-        draw_tick_circle(surf, self.center, self.radius, self.amin, self.amax, step_deg=12, color=(60,70,80))
-        rect = pygame.Rect(0, 0, self.radius*2, self.radius*2)
-        rect.center = self.center
-        rect.inflate_ip(-16, -16)
-        for v0, v1, color in self.arc_zones:
-            a0 = angle_for_value(v0, self.vmin, self.vmax, self.amin, self.amax)
-            a1 = angle_for_value(v1, self.vmin, self.vmax, self.amin, self.amax)
-            draw_arc_section(surf, rect, a0, a1, color, width=10)
-        ang = angle_for_value(value, self.vmin, self.vmax, self.amin, self.amax)
-        draw_pointer(surf, self.center, ang, self.radius - 18, color=FG, width=5)
-        draw_text(surf, self.label, small, MUTED, (self.center[0], self.center[1] + self.radius * 0.55))
-        val_str = f"{value:.1f}{self.unit}" if self.unit else f"{int(value)}"
-        draw_text(surf, val_str, small, FG, (self.center[0], self.center[1] + self.radius * 0.78))
+        self.draw_static(surf, fonts)
+        self.draw_dynamic(surf, fonts, value)
 
 # -----------------------------
 # Icons (vector)
@@ -283,12 +423,16 @@ def icon_arrow_right(surf, center, on, bg=BG):
     pygame.draw.polygon(surf, color, [(x-28, y-14), (x+14, y), (x-28, y+14)])
     pygame.draw.polygon(surf, bg, [(x-20, y-8), (x+6, y), (x-20, y+8)])
 
+_icon_font = None
+
 def icon_parking_brake(surf, center, on):
+    global _icon_font
     x, y = center
     color = RED if on else (70, 50, 50)
     pygame.draw.circle(surf, color, (x, y), 18, 4)
-    f = pygame.font.SysFont(None, 26, bold=True)
-    draw_text(surf, "P", f, color, (x, y))
+    if _icon_font is None:
+        _icon_font = pygame.font.SysFont(None, 26, bold=True)
+    draw_text(surf, "P", _icon_font, color, (x, y))
 
 def icon_parking_lights(surf, center, on):
     x, y = center
@@ -316,11 +460,35 @@ def icon_high_beam(surf, center, on):
 # -----------------------------
 
 class Dashboard:
-    def __init__(self, width=1280, height=720, fullscreen=False, fps=60, udp_port=None):
+    ICON_SIZE = (64, 48)
+    # the only events run() reacts to; everything else is dropped by SDL before reaching Python
+    EVENT_TYPES = [pygame.QUIT, pygame.KEYDOWN, pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED]
+
+    def __init__(self, width=1280, height=720, fullscreen=False, fps=60, udp_port=None, renderer=False, vsync=True):
         pygame.init()
-        flags = pygame.FULLSCREEN if fullscreen else 0
-        self.screen = pygame.display.set_mode((width, height), flags)
-        pygame.display.set_caption("Raspberry Pi Automotive Dashboard")
+        self.renderer = None
+        if renderer:
+            # Compose in software on an off-screen canvas as usual, but present
+            # through SDL_Renderer: only dirty rects are uploaded to a streaming
+            # texture, and scaling/presentation happen on the GPU.
+            from pygame._sdl2.video import Window, Renderer, Texture
+            self.window = Window("Raspberry Pi Automotive Dashboard", size=(width, height),
+                                 fullscreen_desktop=fullscreen)
+            self.renderer = Renderer(self.window, vsync=bool(vsync))
+            self.renderer.logical_size = (width, height)
+            self.screen = pygame.Surface((width, height))
+            self._frame_tex = Texture(self.renderer, (width, height), streaming=True)
+        else:
+            flags = pygame.FULLSCREEN if fullscreen else 0
+            try:
+                # vsync needs pygame's renderer-backed display (SCALED)
+                self.screen = pygame.display.set_mode((width, height), flags | (pygame.SCALED if vsync else 0),
+                                                      vsync=int(bool(vsync)))
+            except pygame.error:
+                self.screen = pygame.display.set_mode((width, height), flags)
+            pygame.display.set_caption("Raspberry Pi Automotive Dashboard")
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self.EVENT_TYPES)
         self.clock = pygame.time.Clock()
         self.fps = fps
         self.running = True
@@ -334,6 +502,9 @@ class Dashboard:
         }
 
         self.sim = SensorSimulator()
+        # ring buffer of recent samples (rows) x HISTORY_FIELDS (columns), for trend widgets/logging
+        self.history = np.zeros((HISTORY_LEN, len(HISTORY_FIELDS)), dtype=np.float32)
+        self._hidx = 0
         self.udp = UdpReceiver(port=udp_port) if udp_port else None
 
         self.W, self.H = self.screen.get_size()
@@ -396,6 +567,61 @@ class Dashboard:
         self.center_area = pygame.Rect(0, 0, int(self.W*0.35), int(self.H*0.34))
         self.center_area.center = (self.W//2, int(self.H*0.34))
         self.icon_row_y = int(self.center_area.bottom + 60)
+        self.lambda_box = pygame.Rect(0, 0, int(self.center_area.width*0.55), 64)
+        self.lambda_box.centerx = self.center_area.centerx
+        self.lambda_box.top = self.center_area.bottom + 8
+
+        # glyph atlas for the speed readout: 11 one-time renders instead of
+        # rasterizing a 160 pt string whenever the speed changes
+        huge = self.fonts['huge']
+        chars = "0123456789-"
+        self._huge_digits = {ch: display_format(huge.render(ch, True, FG)) for ch in chars}
+        # pen advance from one glyph to the next, kerning included
+        self._huge_advance = {(a, b): huge.size(a + b)[0] - huge.size(b)[0] for a in chars for b in chars}
+
+        self.gauges = [self.coolant_g, self.oiltemp_g, self.oilpress_g, self.turbo_g, self.batt_g]
+        self._build_static_layer()
+
+        spacing = int(self.W * 0.09)
+        start_x = int(self.W * 0.5) - spacing*2
+        self._icon_centers = [(start_x + i*spacing, self.icon_row_y) for i in range(6)]
+        # every icon pre-rendered in both states, so the row is six blits
+        icons = (icon_arrow_left, icon_parking_lights, icon_low_beam,
+                 icon_high_beam, icon_arrow_right, icon_parking_brake)
+        self._icon_imgs = [{on: self._render_icon(fn, on) for on in (False, True)} for fn in icons]
+        icon_row = pygame.Rect(0, 0, 5*spacing + self.ICON_SIZE[0], self.ICON_SIZE[1])
+        icon_row.midleft = (start_x - self.ICON_SIZE[0]//2, self.icon_row_y)
+
+        # Value-dependent regions, in paint order: (screen rect, state(s), paint(state)).
+        # A region is repainted only when its state differs from what is on
+        # screen: it is restored from the static layer, repainted with drawing
+        # clipped to the rect, and only those rects are pushed to the display.
+        self._regions = [
+            (self.rpm_bar.rect.inflate(0, 48), lambda s: self.rpm_bar.level(s.rpm),
+             lambda st: self.rpm_bar.draw_level(self.screen, st)),
+            (self.fuel.rect, lambda s: self.fuel.level(s.fuel_level),
+             lambda st: self.fuel.draw_level(self.screen, st)),
+            (self.center_area, lambda s: f"{int(s.speed_kmh):d}", self.draw_speed),
+            (self.lambda_box, lambda s: f"λ {s.lambda_value:.2f}", self.draw_lambda),
+            (self.coolant_g.rect, lambda s: self.coolant_g.state(s.coolant_temp_c),
+             lambda st: self.coolant_g.draw_state(self.screen, self.fonts, st)),
+            (self.oiltemp_g.rect, lambda s: self.oiltemp_g.state(s.oil_temp_c),
+             lambda st: self.oiltemp_g.draw_state(self.screen, self.fonts, st)),
+            (self.oilpress_g.rect, lambda s: self.oilpress_g.state(s.oil_pressure_bar),
+             lambda st: self.oilpress_g.draw_state(self.screen, self.fonts, st)),
+            (self.turbo_g.rect, lambda s: self.turbo_g.state(s.turbo_bar),
+             lambda st: self.turbo_g.draw_state(self.screen, self.fonts, st)),
+            (self.batt_g.rect, lambda s: self.batt_g.state(s.batt_v),
+             lambda st: self.batt_g.draw_state(self.screen, self.fonts, st)),
+            (icon_row, lambda s: (s.left_blinker, s.lights_parking, s.lights_low,
+                                  s.lights_high, s.right_blinker, s.handbrake), self.draw_icons),
+        ]
+        # restoring a rect wipes whatever overlapping regions drew there
+        self._overlaps = [[j for j, (other, _, _) in enumerate(self._regions) if j != i and rect.colliderect(other)]
+                          for i, (rect, _, _) in enumerate(self._regions)]
+        self._drawn = [None] * len(self._regions)
+        self._dirty = []
+        self._full_redraw = True
 
     def get_sensors(self) -> Sensors:
         base = self.sim.update()
@@ -405,65 +631,125 @@ class Dashboard:
                 base = sensors_from_dict(data, base)
         return base
 
-    def draw_background(self):
-        self.screen.fill(BG)
-        pygame.draw.rect(self.screen, (18, 20, 26), self.screen.get_rect(), width=6, border_radius=18)
-        self.rpm_bar.draw_bg(self.screen)
-        draw_roundrect(self.screen, self.center_area, DARK, radius=24, width=0)
-        pygame.draw.rect(self.screen, (30, 32, 38), self.center_area, width=3, border_radius=24)
-        # draw fuel frame; level will be drawn again with real value
-        self.fuel.draw(self.screen, 0.0)
-
-    def draw_speed_and_lambda(self, s: Sensors):
-        draw_text(self.screen, f"{int(s.speed_kmh):d}", self.fonts['huge'], FG, (self.center_area.centerx, self.center_area.centery - 10))
-        draw_text(self.screen, "km/h", self.fonts['small'], MUTED, (self.center_area.centerx, int(self.center_area.centery + self.center_area.height*0.18)))
-        box = pygame.Rect(0, 0, int(self.center_area.width*0.55), 64)
-        box.centerx = self.center_area.centerx
-        box.top = self.center_area.bottom + 8
-        draw_roundrect(self.screen, box, DARK, radius=16, width=0)
-        pygame.draw.rect(self.screen, (30, 32, 38), box, width=2, border_radius=16)
-        draw_text(self.screen, f"λ {s.lambda_value:.2f}", self.fonts['big'], CYAN, box.center)
-
-    def draw_icons(self, s: Sensors):
-        spacing = int(self.W * 0.09)
-        start_x = int(self.W * 0.5) - spacing*2
-        y = self.icon_row_y
-        icon_arrow_left(self.screen, (start_x, y), s.left_blinker)
-        icon_parking_lights(self.screen, (start_x + spacing, y), s.lights_parking)
-        icon_low_beam(self.screen, (start_x + 2*spacing, y), s.lights_low)
-        icon_high_beam(self.screen, (start_x + 3*spacing, y), s.lights_high)
-        icon_arrow_right(self.screen, (start_x + 4*spacing, y), s.right_blinker)
-        icon_parking_brake(self.screen, (start_x + 5*spacing, y), s.handbrake)
+    def record_history(self, s: Sensors):
+        self.history[self._hidx] = (s.speed_kmh, s.rpm, s.fuel_level, s.coolant_temp_c, s.oil_temp_c,
+                                    s.oil_pressure_bar, s.turbo_bar, s.batt_v, s.lambda_value)
+        self._hidx = (self._hidx + 1) % HISTORY_LEN
+
+    def history_ordered(self):
+        """Copy of the history with rows ordered oldest to newest."""
+        return np.roll(self.history, -self._hidx, axis=0)
+
+    def draw_background(self, surf):
+        surf.fill(BG)
+        pygame.draw.rect(surf, (18, 20, 26), surf.get_rect(), width=6, border_radius=18)
+        self.rpm_bar.draw_bg(surf)
+        draw_roundrect(surf, self.center_area, DARK, radius=24, width=0)
+        pygame.draw.rect(surf, (30, 32, 38), self.center_area, width=3, border_radius=24)
+        self.fuel.draw_bg(surf)
+
+    def _build_static_layer(self):
+        # Everything that doesn't depend on sensor values is rendered once here;
+        # each frame starts from a single blit of this surface.
+        bg = pygame.Surface((self.W, self.H)).convert(self.screen)
+        self.draw_background(bg)
+        draw_text(bg, "RPM", self.fonts['small'], MUTED, (self.rpm_bar.rect.centerx, self.rpm_bar.rect.bottom + 20))
+        draw_text(bg, "Fuel", self.fonts['small'], MUTED, (self.fuel.rect.centerx, self.fuel.rect.bottom + 20))
+        draw_text(bg, "E", self.fonts['tiny'], FG, (self.fuel.rect.centerx, self.fuel.rect.bottom + 40))
+        draw_text(bg, "F", self.fonts['tiny'], FG, (self.fuel.rect.centerx, self.fuel.rect.top - 14))
+        draw_text(bg, "km/h", self.fonts['small'], MUTED, (self.center_area.centerx, int(self.center_area.centery + self.center_area.height*0.18)))
+        draw_roundrect(bg, self.lambda_box, DARK, radius=16, width=0)
+        pygame.draw.rect(bg, (30, 32, 38), self.lambda_box, width=2, border_radius=16)
+        for g in self.gauges:
+            g.draw_static(bg, self.fonts)
+        draw_text(bg, "UDP JSON opcional em :5005 • ESC para sair",
+                  self.fonts['tiny'], MUTED, (self.W//2, self.H - 18))
+        self._bg_surface = bg
+
+    def draw_speed(self, text):
+        offsets = [0]
+        for pair in zip(text, text[1:]):
+            offsets.append(offsets[-1] + self._huge_advance[pair])
+        last = self._huge_digits[text[-1]]
+        x = self.center_area.centerx - (offsets[-1] + last.get_width()) // 2
+        y = self.center_area.centery - 10 - last.get_height() // 2
+        for ch, dx in zip(text, offsets):
+            self.screen.blit(self._huge_digits[ch], (x + dx, y))
+
+    def draw_lambda(self, text):
+        draw_text(self.screen, text, self.fonts['big'], CYAN, self.lambda_box.center)
+
+    def _render_icon(self, icon, on):
+        w, h = self.ICON_SIZE
+        img = pygame.Surface((w, h), pygame.SRCALPHA)
+        icon(img, (w//2, h//2), on)
+        return display_format(img)
+
+    def draw_icons(self, on):
+        w, h = self.ICON_SIZE
+        for (x, y), imgs, flag in zip(self._icon_centers, self._icon_imgs, on):
+            self.screen.blit(imgs[flag], (x - w//2, y - h//2))
 
     def draw(self, s: Sensors):
-        self.draw_background()
-        self.rpm_bar.draw_value(self.screen, s.rpm)
-        draw_text(self.screen, "RPM", self.fonts['small'], MUTED, (self.rpm_bar.rect.centerx, self.rpm_bar.rect.bottom + 20))
-        self.fuel.draw(self.screen, s.fuel_level)
-        draw_text(self.screen, "Fuel", self.fonts['small'], MUTED, (self.fuel.rect.centerx, self.fuel.rect.bottom + 20))
-        draw_text(self.screen, "E", self.fonts['tiny'], FG, (self.fuel.rect.centerx, self.fuel.rect.bottom + 40))
-        draw_text(self.screen, "F", self.fonts['tiny'], FG, (self.fuel.rect.centerx, self.fuel.rect.top - 14))
-        self.draw_speed_and_lambda(s)
-        self.coolant_g.draw(self.screen, self.fonts, s.coolant_temp_c)
-        self.oiltemp_g.draw(self.screen, self.fonts, s.oil_temp_c)
-        self.oilpress_g.draw(self.screen, self.fonts, s.oil_pressure_bar)
-        self.turbo_g.draw(self.screen, self.fonts, s.turbo_bar)
-        self.batt_g.draw(self.screen, self.fonts, s.batt_v)
-        self.draw_icons(s)
-        draw_text(self.screen, "UDP JSON opcional em :5005 • ESC para sair",
-                  self.fonts['tiny'], MUTED, (self.W//2, self.H - 18))
+        screen = self.screen
+        states = [state(s) for _, state, _ in self._regions]
+        if self._full_redraw:
+            screen.blit(self._bg_surface, (0, 0))
+            self._dirty.append(screen.get_rect())
+            self._full_redraw = False
+            redraw = range(len(self._regions))
+        else:
+            changed = [i for i, st in enumerate(states) if st != self._drawn[i]]
+            redraw = set(changed)
+            while changed:
+                for j in self._overlaps[changed.pop()]:
+                    if j not in redraw:
+                        redraw.add(j)
+                        changed.append(j)
+            redraw = sorted(redraw)
+            # restore every region before painting any, since some overlap
+            for i in redraw:
+                rect = self._regions[i][0]
+                screen.blit(self._bg_surface, rect, rect)
+                self._dirty.append(rect)
+        for i in redraw:
+            rect, _, paint = self._regions[i]
+            screen.set_clip(rect)
+            paint(states[i])
+            self._drawn[i] = states[i]
+        screen.set_clip(None)
+
+    def present(self):
+        if self.renderer:
+            canvas = self.screen.get_rect()
+            for rect in self._dirty:
+                rect = rect.clip(canvas)
+                self._frame_tex.update(self.screen.subsurface(rect), rect)
+            self.renderer.clear()
+            self._frame_tex.draw()
+            self.renderer.present()
+        else:
+            pygame.display.update(self._dirty)
+        self._dirty.clear()
 
     def run(self):
         while self.running:
-            for ev in pygame.event.get():
+            for ev in pygame.event.get(eventtype=self.EVENT_TYPES):
                 if ev.type == pygame.QUIT:
                     self.running = False
                 elif ev.type == pygame.KEYDOWN and ev.key == pygame.K_ESCAPE:
                     self.running = False
+                elif ev.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    self._full_redraw = True
             s = self.get_sensors()
+            self.record_history(s)
             self.draw(s)
-            pygame.display.flip()
+            self.present()
+            # With vsync, present() already waits for the vblank and this returns
+            # at once; it still caps the rate where vsync is silently unavailable.
             self.clock.tick(self.fps)
+        if self.udp:
+            self.udp.close()
         pygame.quit()
 
 def main():
@@ -473,8 +759,11 @@ def main():
     parser.add_argument("--fullscreen", action="store_true", help="Tela cheia")
     parser.add_argument("--fps", type=int, default=60, help="Frames por segundo")
     parser.add_argument("--udp-port", type=int, default=None, help="Porta UDP para receber JSON de sensores")
+    parser.add_argument("--renderer", action="store_true", help="Apresenta via SDL_Renderer (GPU) em vez da surface de vídeo")
+    parser.add_argument("--vsync", type=int, choices=(0, 1), default=1, help="Sincroniza com o refresh do monitor (1) ou não (0)")
     args = parser.parse_args()
-    app = Dashboard(width=args.w, height=args.h, fullscreen=args.fullscreen, fps=args.fps, udp_port=args.udp_port)
+    app = Dashboard(width=args.w, height=args.h, fullscreen=args.fullscreen, fps=args.fps, udp_port=args.udp_port,
+                    renderer=args.renderer, vsync=bool(args.vsync))
     app.run()
 
 if __name__ == "__main__":
@@ -6,9 +6,16 @@ Dashboard Automotivo - Estética S2000 (late 90s/early 2000s)
 - Simulador embutido + entrada UDP/JSON opcional (--udp-port 5005)
 - Display sete segmentos (speed) sem fontes externas
 """
-import math, json, random, time, argparse, socket
-from dataclasses import dataclass, asdict
+import math, json, random, time, argparse, socket, threading
+from dataclasses import dataclass, fields, replace
+from functools import lru_cache
+import numpy as np
 import pygame
+try: from numba import njit
+except ImportError:  # numba is optional; without it _sim_math runs as plain Python
+    def njit(*args,**kwargs): return args[0] if len(args)==1 and callable(args[0]) else (lambda fn: fn)
+try: from orjson import loads as json_loads
+except ImportError: json_loads=json.loads  # orjson is optional; json.loads also takes bytes
 
 BG=(5,5,8); PANEL=(12,12,16); EDGE=(28,28,32); WHITE=(240,240,245); MUTED=(150,150,160)
 ORANGE=(255,150,60); RED=(255,70,60); RED_SEG=(255,40,30); RED_GLOW=(255,30,20)
@@ -17,7 +24,12 @@ AMBER=(255,180,80); GREEN=(80,230,120); BLUE=(90,180,255); CYAN=(0,220,220)
 def clamp(v,a,b): return max(a,min(b,v))
 def lerp(a,b,t): return a+(b-a)*t
 
-@dataclass
+@lru_cache(maxsize=32)
+def get_font(size,bold=False):
+    """SysFont scans the system font list and opens the file; do it once per (size, bold). Needs pygame.init()."""
+    return pygame.font.SysFont(None,size,bold=bold)
+
+@dataclass(slots=True)
 class Sensors:
     speed_kmh: float = 0.0
     rpm: float = 800.0
@@ -34,44 +46,66 @@ class Sensors:
     lights_parking: bool = False
     lights_low: bool = False
     lights_high: bool = False
+_SENSOR_FIELDS=tuple(f.name for f in fields(Sensors))
+
+@njit(cache=True,fastmath=True)
+def _sim_math(t,noise_speed,noise_rpm,out):
+    """Writes speed, rpm, fuel, coolant, oil temp, oil press, turbo, batt, lambda, then blink/handbrake/parking/high as 0/1, into out[:13]."""
+    rpm=max(650.0,min(8000.0,1200+6000*(0.5+0.5*math.sin(t*1.05))+noise_rpm))
+    fuel=0.8-(t*0.00045); fuel=(fuel%1.0) if fuel<0 else max(0.02,min(0.98,fuel))
+    out[0]=max(0.0,min(260.0,140*(0.5+0.5*math.sin(t*0.40))+noise_speed)); out[1]=rpm; out[2]=fuel
+    out[3]=max(10.0,min(120.0,75+25*(0.5+0.5*math.sin(t*0.18))))
+    out[4]=max(60.0,min(130.0,85+25*(0.5+0.5*math.sin(t*0.16+0.8))))
+    out[5]=max(0.3,min(6.9,0.9+(rpm/8000.0)*5.6+0.1*math.sin(t*1.4)))
+    out[6]=max(-0.9,min(2.9,-0.2+(rpm/8000.0)*2.4+0.1*math.sin(t*0.8)))
+    out[7]=max(9.0,min(16.0,13.5+0.35*math.sin(t*0.25)))
+    out[8]=max(0.6,min(3.0,1.0+0.1*math.sin(t*1.6)))
+    out[9]=math.sin(t*math.tau*0.75)>0.0; out[10]=math.sin(t*0.07)>0.94
+    out[11]=math.sin(t*0.15)>0.6; out[12]=math.sin(t*0.12)>0.85
 
 class SensorSimulator:
-    def __init__(self): self.t0=time.perf_counter()
+    def __init__(self): self.t0=time.perf_counter(); self._out=np.empty(13)
     def update(self)->Sensors:
         t=time.perf_counter()-self.t0
-        speed=140*(0.5+0.5*math.sin(t*0.40)); speed=clamp(speed+random.uniform(-1.0,1.0),0,260)
-        rpm=1200+6000*(0.5+0.5*math.sin(t*1.05)); rpm=clamp(rpm+random.uniform(-40,40),650,8000)
-        fuel=0.8-(t*0.00045); fuel=(fuel%1.0) if fuel<0 else clamp(fuel,0.02,0.98)
-        coolant=clamp(75+25*(0.5+0.5*math.sin(t*0.18)),10,120)
-        oil_temp=clamp(85+25*(0.5+0.5*math.sin(t*0.16+0.8)),60,130)
-        oil_press=clamp(0.9+(rpm/8000.0)*5.6+0.1*math.sin(t*1.4),0.3,6.9)
-        turbo=clamp(-0.2+(rpm/8000.0)*2.4+0.1*math.sin(t*0.8),-0.9,2.9)
-        batt=clamp(13.5+0.35*math.sin(t*0.25),9,16)
-        lam=clamp(1.0+0.1*math.sin(t*1.6),0.6,3.0)
-        blink=(math.sin(t*math.tau*0.75)>0.0)
+        _sim_math(t,random.uniform(-1.0,1.0),random.uniform(-40,40),self._out)
+        speed,rpm,fuel,coolant,oil_temp,oil_press,turbo,batt,lam,blink,hb,park,high=self._out.tolist()
         return Sensors(speed_kmh=speed,rpm=rpm,fuel_level=fuel,coolant_temp_c=coolant,oil_temp_c=oil_temp,
                        oil_pressure_bar=oil_press,turbo_bar=turbo,batt_v=batt,lambda_value=lam,
-                       left_blinker=blink,right_blinker=not blink,handbrake=(math.sin(t*0.07)>0.94),
-                       lights_parking=(math.sin(t*0.15)>0.6),lights_low=True,lights_high=(math.sin(t*0.12)>0.85))
+                       left_blinker=blink>0,right_blinker=not blink,handbrake=hb>0,
+                       lights_parking=park>0,lights_low=True,lights_high=high>0)
 
 class UdpReceiver:
+    """Receives and parses on a daemon thread; poll() just returns the newest packet, so the render loop never touches the socket."""
     def __init__(self,host="0.0.0.0",port=5005):
-        self.sock=socket.socket(socket.AF_INET,socket.SOCK_DGRAM); self.sock.setblocking(False); self.sock.bind((host,port)); self.last=None
-    def poll(self):
-        try:
-            data,_=self.sock.recvfrom(8192); self.last=json.loads(data.decode("utf-8"))
-        except BlockingIOError: pass
-        except Exception: pass
-        return self.last
+        self.sock=socket.socket(socket.AF_INET,socket.SOCK_DGRAM); self.last=None
+        try: self.sock.setsockopt(socket.SOL_SOCKET,socket.SO_RCVBUF,1<<20)  # absorb bursts instead of dropping
+        except OSError: pass
+        self.sock.bind((host,port)); self.sock.settimeout(0.2)  # blocking, but wakes up to notice close()
+        self._buf=bytearray(8192); self._view=memoryview(self._buf)  # reused for every datagram
+        self._stop=threading.Event(); self._thread=threading.Thread(target=self._rx_loop,name="udp-receiver",daemon=True); self._thread.start()
+    def _rx_loop(self):
+        while not self._stop.is_set():
+            try: n=self.sock.recv_into(self._buf)
+            except socket.timeout: continue
+            except OSError: break
+            try: self.last=json_loads(self._view[:n].tobytes())  # single reference swap, atomic under the GIL
+            except Exception: pass
+    def poll(self): return self.last
+    def close(self): self._stop.set(); self._thread.join(); self.sock.close()
 
 def sensors_from_dict(obj:dict,fallback:Sensors)->Sensors:
-    d=asdict(fallback)
-    for k in d.keys():
-        if k in obj: d[k]=obj[k]
-    return Sensors(**d)
+    return replace(fallback,**{k:obj[k] for k in _SENSOR_FIELDS if k in obj})  # fallback itself is left untouched
+
+def display_format(surf,alpha=True):
+    """Convert to the display's pixel format so blits take SDL's fast path (no-op before set_mode)."""
+    if not pygame.display.get_surface(): return surf
+    return surf.convert_alpha() if alpha else surf.convert()
+
+@lru_cache(maxsize=256)
+def _render_text(text,font,color): return display_format(font.render(text,True,color))
 
 def draw_text(surf,text,font,color,pos,align="center"):
-    img=font.render(text,True,color); r=img.get_rect(); setattr(r,align,pos); surf.blit(img,r)
+    img=_render_text(text,font,color); r=img.get_rect(); setattr(r,align,pos); surf.blit(img,r)
 
 def ring_point(center,radius,angle_deg):
     a=math.radians(angle_deg); return (center[0]+radius*math.cos(a), center[1]+radius*math.sin(a))
@@ -83,8 +117,17 @@ class SevenSeg:
     DIGITS={'0':(1,1,1,1,1,1,0),'1':(0,1,1,0,0,0,0),'2':(1,1,0,1,1,0,1),'3':(1,1,1,1,0,0,1),
             '4':(0,1,1,0,0,1,1),'5':(1,0,1,1,0,1,1),'6':(1,0,1,1,1,1,1),'7':(1,1,1,0,0,0,0),
             '8':(1,1,1,1,1,1,1),'9':(1,1,1,1,0,1,1),'-':(0,0,0,0,0,0,1),' ':(0,0,0,0,0,0,0)}
-    def __init__(self, seg_w=16, seg_h=80, seg_gap=4, color=RED_SEG):
-        self.seg_w=seg_w; self.seg_h=seg_h; self.seg_gap=seg_gap; self.color=color; self.off=(60,20,20)
+    GLOW_PAD=6  # glow spills this far outside the digit box
+    def __init__(self, seg_w=16, seg_h=80, seg_gap=4, color=RED_SEG, bg=(20,8,8)):
+        self.seg_w=seg_w; self.seg_h=seg_h; self.seg_gap=seg_gap; self.color=color; self.off=(60,20,20); self.bg=bg
+        self._cache={}
+    def _render_digit(self,ch,w,h,glow):
+        """Digit baked once over the panel color (the additive glow needs an opaque backdrop)."""
+        key=(ch,w,h,glow); img=self._cache.get(key)
+        if img is None:
+            p=self.GLOW_PAD; img=pygame.Surface((w+2*p,h+2*p)); img.fill(self.bg)
+            self.draw_digit(img,p,p,w,h,ch,glow); img=display_format(img,False); self._cache[key]=img
+        return img
     def draw_digit(self,surf,x,y,w,h,ch,glow=True):
         a=pygame.Rect(x+self.seg_w,y,w-2*self.seg_w,self.seg_w)
         d=pygame.Rect(x+self.seg_w,y+h-self.seg_w,w-2*self.seg_w,self.seg_w)
@@ -94,92 +137,135 @@ class SevenSeg:
         b=pygame.Rect(x+w-self.seg_w,y+self.seg_w,self.seg_w,(h-3*self.seg_w)//2)
         c=pygame.Rect(x+w-self.seg_w,y+(h+self.seg_w)//2,self.seg_w,(h-3*self.seg_w)//2)
         rects=[a,b,c,d,e,f,g]
-        on=self.DIGITS.get(ch,self.DIGITS[' '])
+        on=self.DIGITS.get(ch,self.DIGITS[' ']); glow_surf=None
         for i,r in enumerate(rects):
             if on[i]:
                 pygame.draw.rect(surf,self.color,r,border_radius=6)
                 if glow:
                     glow_rect=r.inflate(12,12)
-                    glow_surf=pygame.Surface(glow_rect.size,pygame.SRCALPHA)
-                    pygame.draw.rect(glow_surf,(*RED_GLOW,40),glow_surf.get_rect(),border_radius=10)
+                    if glow_surf is None or glow_surf.get_size()!=glow_rect.size:
+                        glow_surf=pygame.Surface(glow_rect.size,pygame.SRCALPHA)
+                        pygame.draw.rect(glow_surf,(*RED_GLOW,40),glow_surf.get_rect(),border_radius=10)
                     surf.blit(glow_surf,glow_rect.topleft,special_flags=pygame.BLEND_ADD)
             else:
                 pygame.draw.rect(surf,(60,20,20),r,border_radius=6)
-    def draw_string(self,surf,pos,text,scale=1.0,spacing=12):
-        x,y=pos; w=int(64*scale); h=int(110*scale)
+    def draw_string(self,surf,pos,text,scale=1.0,spacing=12,glow=True):
+        x,y=pos; w=int(64*scale); h=int(110*scale); p=self.GLOW_PAD
         for ch in text:
-            self.draw_digit(surf,x,y,w,h,ch); x+=w+spacing
+            surf.blit(self._render_digit(ch,w,h,glow),(x-p,y-p)); x+=w+spacing
 
 class TachArc:
     def __init__(self, center, radius, width=28, start=-172, end=-8, red_from=8000):
         self.center=center; self.radius=radius; self.width=width; self.start=start; self.end=end; self.red_from=red_from
         self.segments=[]; self.scale_marks=[]; self._build()
+        self._draw_rect=pygame.Rect(0,0,radius*2,radius*2); self._draw_rect.center=center; self._draw_rect.inflate_ip(-20,-20)
+        self._static_surf=None; self._static_pos=(0,0); self.bounds=None
     def _build(self):
         angle_span=self.end-self.start; seg_angle=2.9
         a=self.start
         while a<self.end-0.001:
             b=min(a+seg_angle,self.end); self.segments.append((a,b)); a=b
+        self._seg_rad=[(math.radians(a),math.radians(b)) for a,b in self.segments]
         step=angle_span/9.0
         for i in range(10):
             ang=self.start+i*step; self.scale_marks.append((i,ang))
-    def draw(self,surf,rpm):
-        rect=pygame.Rect(0,0,self.radius*2,self.radius*2); rect.center=self.center; rect.inflate_ip(-20,-20)
+        # tick lines go over the lit segments, so they stay per-frame (endpoints only computed once)
+        self._tick_lines=[(ring_point(self.center,self.radius-6,ang),ring_point(self.center,self.radius-6-self.width,ang)) for _,ang in self.scale_marks]
+    def _render_static(self,size):
+        """Dim arc, scale numbers and unit label: everything under/around the lit segments that doesn't depend on rpm."""
+        s=pygame.Surface(size,pygame.SRCALPHA)
+        pygame.draw.arc(s,(60,35,18),self._draw_rect,math.radians(self.start),math.radians(self.end),self.width)  # dim track is contiguous
+        for i,ang in self.scale_marks:
+            tpos=ring_point(self.center,self.radius-self.width-24,ang-2)
+            draw_text(s,str(i),get_font(26,True),WHITE,(int(tpos[0]),int(tpos[1])),"center")
+        draw_text(s,"x1000 r/min",get_font(20),MUTED,(self.center[0]-self.radius+40,self.center[1]+18),"center")
+        crop=s.get_bounding_rect(); self._static_surf=display_format(s.subsurface(crop).copy()); self._static_pos=crop.topleft
+        xs=[p[0] for l in self._tick_lines for p in l]; ys=[p[1] for l in self._tick_lines for p in l]
+        self.bounds=crop.union(pygame.Rect(min(xs)-2,min(ys)-2,max(xs)-min(xs)+5,max(ys)-min(ys)+5))  # everything draw() touches
+    def draw_static(self,surf):
+        if self._static_surf is None: self._render_static(surf.get_size())
+        surf.blit(self._static_surf,self._static_pos)
+    def draw_dynamic(self,surf,rpm):
         val_per_seg=9000.0/len(self.segments); cur_val=0.0
-        for (a,b) in self.segments:
-            pygame.draw.arc(surf,(60,35,18),rect,math.radians(a),math.radians(b),self.width)
-        for (a,b) in self.segments:
+        for (a,b) in self._seg_rad:
             cur_val+=val_per_seg
             if cur_val<=clamp(rpm,0,9000):
                 col=ORANGE if (cur_val<self.red_from) else RED
-                pygame.draw.arc(surf,col,rect,math.radians(a),math.radians(b),self.width)
-        font=pygame.font.SysFont(None,26,bold=True)
-        for i,ang in self.scale_marks:
-            p1=ring_point(self.center,self.radius-6,ang); p2=ring_point(self.center,self.radius-6-self.width,ang)
-            pygame.draw.line(surf,WHITE,p1,p2,2)
-            tpos=ring_point(self.center,self.radius-self.width-24,ang-2)
-            draw_text(surf,str(i),font,WHITE,(int(tpos[0]),int(tpos[1])),"center")
-        font2=pygame.font.SysFont(None,20); draw_text(surf,"x1000 r/min",font2,MUTED,(self.center[0]-self.radius+40,self.center[1]+18),"center")
+                pygame.draw.arc(surf,col,self._draw_rect,a,b,self.width)
+        for p1,p2 in self._tick_lines: pygame.draw.line(surf,WHITE,p1,p2,2)
+    def draw(self,surf,rpm): self.draw_static(surf); self.draw_dynamic(surf,rpm)
 
 class MiniArc:
     def __init__(self, center, radius, start=200, end=340, width=18, segs=16):
         self.center=center; self.radius=radius; self.start=start; self.end=end; self.width=width; self.segs=segs
-    def draw(self,surf,value01,labels=("L","H")):
-        rect=pygame.Rect(0,0,self.radius*2,self.radius*2); rect.center=self.center; rect.inflate_ip(-16,-16)
-        ang_span=self.end-self.start; per=clamp(value01,0.0,1.0); fill_to=self.start+ang_span*per
-        for i in range(self.segs):
-            a=lerp(self.start,self.end,i/self.segs); b=lerp(self.start,self.end,(i+1)/self.segs)-1.5
-            bg=(40,35,30); pygame.draw.arc(surf,bg,rect,math.radians(a),math.radians(b),self.width)
-            if b<=fill_to:
-                col=ORANGE if i<self.segs*0.8 else RED
-                pygame.draw.arc(surf,col,rect,math.radians(a),math.radians(b),self.width)
-        font=pygame.font.SysFont(None,22,bold=True)
+        self._bg=None; self._bg_pos=(0,0); self._bg_labels=None; self.bounds=None
+        self._draw_rect=pygame.Rect(0,0,radius*2,radius*2); self._draw_rect.center=center; self._draw_rect.inflate_ip(-16,-16)
+        # (end angle in degrees, start/end in radians, lit color) per segment
+        self._seg_angles=[]
+        for i in range(segs):
+            a=lerp(start,end,i/segs); b=lerp(start,end,(i+1)/segs)-1.5
+            self._seg_angles.append((b,math.radians(a),math.radians(b),ORANGE if i<segs*0.8 else RED))
+    def _render_bg(self,size,labels):
+        s=pygame.Surface(size,pygame.SRCALPHA)
+        for _,a,b,_ in self._seg_angles: pygame.draw.arc(s,(40,35,30),self._draw_rect,a,b,self.width)
         pL=ring_point(self.center,self.radius-self.width-8,self.start-4); pH=ring_point(self.center,self.radius-self.width-8,self.end+4)
-        draw_text(surf,labels[0],font,WHITE,(int(pL[0]),int(pL[1])),"center")
-        draw_text(surf,labels[1],font,WHITE,(int(pH[0]),int(pH[1])),"center")
+        font=get_font(22,True)
+        draw_text(s,labels[0],font,WHITE,(int(pL[0]),int(pL[1])),"center")
+        draw_text(s,labels[1],font,WHITE,(int(pH[0]),int(pH[1])),"center")
+        crop=s.get_bounding_rect(); self._bg=display_format(s.subsurface(crop).copy()); self._bg_pos=crop.topleft; self._bg_labels=labels; self.bounds=crop
+    def draw_static(self,surf,labels=("L","H")):
+        if labels!=self._bg_labels: self._render_bg(surf.get_size(),labels)
+        surf.blit(self._bg,self._bg_pos)
+    def draw_dynamic(self,surf,value01):
+        ang_span=self.end-self.start; per=clamp(value01,0.0,1.0); fill_to=self.start+ang_span*per
+        for b_deg,a,b,col in self._seg_angles:
+            if b_deg>fill_to: break
+            pygame.draw.arc(surf,col,self._draw_rect,a,b,self.width)
+    def draw(self,surf,value01,labels=("L","H")): self.draw_static(surf,labels); self.draw_dynamic(surf,value01)
 
 class FuelBar:
     def __init__(self, rect, segments=14):
         self.rect=pygame.Rect(rect); self.segments=segments
-    def draw(self,surf,level01):
-        r=self.rect.inflate(-8,-8); seg_h=r.height/self.segments; reserve_cut=int(self.segments*0.12)
-        rounded_rect(surf,self.rect,PANEL,radius=14,width=0); pygame.draw.rect(surf,EDGE,self.rect,width=3,border_radius=14)
-        for i in range(self.segments):
-            y0=r.bottom-(i+1)*seg_h; cell=pygame.Rect(r.left,y0+2,r.width,seg_h-4)
-            pygame.draw.rect(surf,(35,32,28),cell,border_radius=6)
-            if (i/(self.segments-1))<=clamp(level01,0,1):
-                col=AMBER if i>reserve_cut else RED; pygame.draw.rect(surf,col,cell,border_radius=6)
-        font=pygame.font.SysFont(None,22,bold=True)
-        draw_text(surf,"E",font,WHITE,(self.rect.centerx,self.rect.bottom+16),"center")
-        draw_text(surf,"F",font,WHITE,(self.rect.centerx,self.rect.top-16),"center")
+        r=self.rect.inflate(-8,-8); seg_h=r.height/segments; reserve_cut=int(segments*0.12)
+        # (fill threshold, cell rect, lit color) bottom to top
+        self._cells=[(i/(segments-1),pygame.Rect(r.left,r.bottom-(i+1)*seg_h+2,r.width,seg_h-4),AMBER if i>reserve_cut else RED) for i in range(segments)]
+        self._bg_surf=None; self._bg_pos=(0,0); self.bounds=None
+    def _render_bg(self,size):
+        """Panel, rim, empty cells and E/F labels."""
+        s=pygame.Surface(size,pygame.SRCALPHA); font=get_font(22,True)
+        rounded_rect(s,self.rect,PANEL,radius=14,width=0); pygame.draw.rect(s,EDGE,self.rect,width=3,border_radius=14)
+        for _,cell,_ in self._cells: pygame.draw.rect(s,(35,32,28),cell,border_radius=6)
+        draw_text(s,"E",font,WHITE,(self.rect.centerx,self.rect.bottom+16),"center")
+        draw_text(s,"F",font,WHITE,(self.rect.centerx,self.rect.top-16),"center")
+        crop=s.get_bounding_rect(); self._bg_surf=display_format(s.subsurface(crop).copy()); self._bg_pos=crop.topleft; self.bounds=crop
+    def draw_static(self,surf):
+        if self._bg_surf is None: self._render_bg(surf.get_size())
+        surf.blit(self._bg_surf,self._bg_pos)
+    def draw_dynamic(self,surf,level01):
+        lvl=clamp(level01,0,1)
+        for t,cell,col in self._cells:
+            if t>lvl: break
+            pygame.draw.rect(surf,col,cell,border_radius=6)
+    def draw(self,surf,level01): self.draw_static(surf); self.draw_dynamic(surf,level01)
+
+ICON_SIZE=(64,48)
+_ICON_CACHE={}
+def _blit_icon(surf,center,draw_fn,*args):
+    """Icons only have a handful of states: draw each (draw_fn, args) once into a small surface and blit it."""
+    key=(draw_fn,)+args; img=_ICON_CACHE.get(key)
+    if img is None:
+        img=pygame.Surface(ICON_SIZE,pygame.SRCALPHA); draw_fn(img,(ICON_SIZE[0]//2,ICON_SIZE[1]//2),*args)
+        img=display_format(img); _ICON_CACHE[key]=img
+    surf.blit(img,(center[0]-ICON_SIZE[0]//2,center[1]-ICON_SIZE[1]//2))
 
-def icon_arrow(surf,center,left=True,on=True):
+def _draw_arrow(surf,center,left,on):
     x,y=center; col=GREEN if on else (60,70,60)
     if left: pts=[(x+28,y-12),(x-12,y),(x+28,y+12)]; cut=[(x+18,y-6),(x-4,y),(x+18,y+6)]
     else:    pts=[(x-28,y-12),(x+12,y),(x-28,y+12)];  cut=[(x-18,y-6),(x+4,y),(x-18,y+6)]
     pygame.draw.polygon(surf,col,pts); pygame.draw.polygon(surf,BG,cut)
-def icon_circle_P(surf,center,on):
-    col=RED if on else (70,40,40); pygame.draw.circle(surf,col,center,14,3); f=pygame.font.SysFont(None,22,bold=True); draw_text(surf,"P",f,col,center,"center")
-def icon_lights(surf,center,mode,on):
+def _draw_circle_P(surf,center,on):
+    col=RED if on else (70,40,40); pygame.draw.circle(surf,col,center,14,3); draw_text(surf,"P",get_font(22,True),col,center,"center")
+def _draw_lights(surf,center,mode,on):
     x,y=center
     if mode=='park':
         col=GREEN if on else (60,70,60); pygame.draw.circle(surf,col,(x-8,y),7,2)
@@ -191,13 +277,18 @@ def icon_lights(surf,center,mode,on):
         col=BLUE if on else (55,60,70); pygame.draw.circle(surf,col,(x-8,y),7,2)
         for i in range(-2,3): pygame.draw.line(surf,col,(x+2,y-10+i*5),(x+26,y-10+i*5),2)
 
+def icon_arrow(surf,center,left=True,on=True): _blit_icon(surf,center,_draw_arrow,left,on)
+def icon_circle_P(surf,center,on): _blit_icon(surf,center,_draw_circle_P,on)
+def icon_lights(surf,center,mode,on): _blit_icon(surf,center,_draw_lights,mode,on)
+
 class Dashboard:
     def __init__(self,width=1280,height=720,fullscreen=False,fps=60,udp_port=None):
         pygame.init(); flags=pygame.FULLSCREEN if fullscreen else pygame.SCALED
         self.screen=pygame.display.set_mode((width,height),flags); pygame.display.set_caption("Dashboard Retro S2000")
         self.clock=pygame.time.Clock(); self.fps=fps; self.running=True
-        self.font_small=pygame.font.SysFont(None,22); self.font_med=pygame.font.SysFont(None,28,bold=True)
+        self.font_small=get_font(22); self.font_med=get_font(28,True)
         self.sevseg=SevenSeg(); self.sim=SensorSimulator(); self.udp=UdpReceiver(port=udp_port) if udp_port else None
+        self._sim_interval=1/20; self._next_sim=0.0; self._cached_s=None  # the simulated signals are slow; 20 Hz is plenty
         self.W,self.H=self.screen.get_size()
         self.center=(self.W//2,int(self.H*0.40))
         self.tach=TachArc(center=(self.center[0],int(self.H*0.36)),radius=int(self.W*0.42))
@@ -207,21 +298,41 @@ class Dashboard:
         self.fuel=FuelBar((int(self.W*0.08),int(self.H*0.30),fuel_w,fuel_h))
         self.speed_rect=pygame.Rect(0,0,int(self.W*0.26),int(self.H*0.18)); self.speed_rect.center=(self.center[0],int(self.H*0.53))
         self.icons_y=int(self.H*0.66); self.icon_spacing=int(self.W*0.08)
+        # everything that doesn't change is drawn once into _static; each frame only the dynamic
+        # regions are restored from it, redrawn and pushed with display.update()
+        self._static=self._build_static_layer()
+        # fuel and mini gauges sit on top of the lit tach segments, so they're drawn whole every frame
+        # instead of living in _static; this primes their cached backgrounds (and bounds) before the first frame
+        self.fuel.draw_static(self.screen); self.mini1.draw_static(self.screen,labels=("L","H")); self.mini2.draw_static(self.screen,labels=("0","7"))
+        lam_box=pygame.Rect(0,0,self.speed_rect.w,36); lam_box.center=(self.speed_rect.centerx,self.speed_rect.bottom+26)
+        info_box=pygame.Rect(0,0,int(self.W*0.6),30); info_box.center=(self.center[0],self.speed_rect.bottom+54)
+        icon_box=pygame.Rect(self.center[0]-2*self.icon_spacing-ICON_SIZE[0]//2,self.icons_y-ICON_SIZE[1]//2,5*self.icon_spacing+ICON_SIZE[0],ICON_SIZE[1])
+        self._regions=[self.tach.bounds,self.speed_rect,lam_box,self.fuel.bounds,self.mini1.bounds,self.mini2.bounds,info_box,icon_box]
+        self._dirty=[]; self._full_redraw=True
     def get_sensors(self)->Sensors:
-        base=self.sim.update()
+        now=time.perf_counter()
+        if now>=self._next_sim: self._cached_s=self.sim.update(); self._next_sim=now+self._sim_interval
+        base=self._cached_s
         if self.udp:
             data=self.udp.poll()
             if data: base=sensors_from_dict(data,base)
         return base
-    def bg(self):
-        self.screen.fill(BG)
-        overlay=pygame.Surface(self.screen.get_size(),pygame.SRCALPHA)
+    def bg(self,surf):
+        surf.fill(BG)
+        overlay=pygame.Surface(surf.get_size(),pygame.SRCALPHA)
         pygame.draw.ellipse(overlay,(0,0,0,120),(-int(self.W*0.05),-int(self.H*0.70),int(self.W*1.1),int(self.H*1.2)))
-        self.screen.blit(overlay,(0,0))
+        surf.blit(overlay,(0,0))
         rim=pygame.Rect(int(self.W*0.03),int(self.H*0.14),int(self.W*0.94),int(self.H*0.74))
-        rounded_rect(self.screen,rim,PANEL,radius=30,width=0); pygame.draw.rect(self.screen,EDGE,rim,width=4,border_radius=30)
+        rounded_rect(surf,rim,PANEL,radius=30,width=0); pygame.draw.rect(surf,EDGE,rim,width=4,border_radius=30)
+    def _build_static_layer(self):
+        layer=pygame.Surface(self.screen.get_size()).convert(self.screen); self.bg(layer); self.tach.draw_static(layer)
+        rounded_rect(layer,self.speed_rect,(20,8,8),radius=18,width=0); pygame.draw.rect(layer,(60,18,18),self.speed_rect,width=3,border_radius=18)
+        draw_text(layer,"Fuel",self.font_small,MUTED,(self.fuel.rect.centerx,self.fuel.rect.bottom+28),"center")
+        draw_text(layer,"Temp. Água",self.font_small,MUTED,(self.mini1.center[0],self.mini1.center[1]+self.mini1.radius*0.65),"center")
+        draw_text(layer,"Press. Óleo",self.font_small,MUTED,(self.mini2.center[0],self.mini2.center[1]+self.mini2.radius*0.65),"center")
+        self.draw_footer(layer)
+        return layer
     def draw_speed(self,speed,lam):
-        rounded_rect(self.screen,self.speed_rect,(20,8,8),radius=18,width=0); pygame.draw.rect(self.screen,(60,18,18),self.speed_rect,width=3,border_radius=18)
         s=f"{int(speed):3d}"[-3:].rjust(3," "); digit_w=64; spacing=14; total_w=3*digit_w+2*spacing
         x0=self.speed_rect.centerx-total_w//2; y0=self.speed_rect.top+8; self.sevseg.draw_string(self.screen,(x0,y0),s,scale=1.0,spacing=spacing)
         draw_text(self.screen,"km/h",self.font_small,MUTED,(self.speed_rect.right-12,self.speed_rect.centery+18),"midright")
@@ -235,25 +346,28 @@ class Dashboard:
         icon_arrow(self.screen,(cx+4*self.icon_spacing,y),left=False,on=s.right_blinker)
         icon_circle_P(self.screen,(cx+5*self.icon_spacing,y),s.handbrake)
     def draw_mini_gauges(self,s):
-        v1=(s.coolant_temp_c-10)/(120-10); self.mini1.draw(self.screen,v1,labels=("L","H"))
-        draw_text(self.screen,"Temp. Água",self.font_small,MUTED,(self.mini1.center[0],self.mini1.center[1]+self.mini1.radius*0.65),"center")
-        v2=(s.oil_pressure_bar-0)/7.0; self.mini2.draw(self.screen,v2,labels=("0","7"))
-        draw_text(self.screen,"Press. Óleo",self.font_small,MUTED,(self.mini2.center[0],self.mini2.center[1]+self.mini2.radius*0.65),"center")
-    def draw_footer(self):
-        draw_text(self.screen,"Retro S2000 • UDP :5005 (opcional) • ESC para sair",self.font_small,MUTED,(self.W//2,int(self.H*0.95)),"center")
+        self.mini1.draw(self.screen,(s.coolant_temp_c-10)/(120-10),labels=("L","H")); self.mini2.draw(self.screen,(s.oil_pressure_bar-0)/7.0,labels=("0","7"))
+    def draw_footer(self,surf):
+        draw_text(surf,"Retro S2000 • UDP :5005 (opcional) • ESC para sair",self.font_small,MUTED,(self.W//2,int(self.H*0.95)),"center")
     def draw(self,s):
-        self.bg(); self.tach.draw(self.screen,s.rpm); self.draw_speed(s.speed_kmh,s.lambda_value)
-        self.fuel.draw(self.screen,s.fuel_level); draw_text(self.screen,"Fuel",self.font_small,MUTED,(self.fuel.rect.centerx,self.fuel.rect.bottom+28),"center")
-        self.draw_mini_gauges(s)
+        # restore every dynamic region first, then draw, so overlapping regions can't wipe each other
+        if self._full_redraw: self.screen.blit(self._static,(0,0)); self._dirty=[self.screen.get_rect()]; self._full_redraw=False
+        else:
+            for r in self._regions: self.screen.blit(self._static,r,r)
+            self._dirty=self._regions
+        self.tach.draw_dynamic(self.screen,s.rpm); self.draw_speed(s.speed_kmh,s.lambda_value)
+        self.fuel.draw(self.screen,s.fuel_level); self.draw_mini_gauges(s)
         info=f"TUR {s.turbo_bar:+.1f} bar   BAT {s.batt_v:.1f} V   ÓLEO {s.oil_temp_c:.0f}°C"
         draw_text(self.screen,info,self.font_small,MUTED,(self.center[0],self.speed_rect.bottom+54),"center")
-        self.draw_icons(s); self.draw_footer()
+        self.draw_icons(s)
     def run(self):
         while self.running:
             for e in pygame.event.get():
                 if e.type==pygame.QUIT: self.running=False
                 if e.type==pygame.KEYDOWN and e.key==pygame.K_ESCAPE: self.running=False
-            s=self.get_sensors(); self.draw(s); pygame.display.flip(); self.clock.tick(self.fps)
+                if e.type in (pygame.VIDEOEXPOSE,pygame.WINDOWEXPOSED): self._full_redraw=True
+            s=self.get_sensors(); self.draw(s); pygame.display.update(self._dirty); self.clock.tick(self.fps)
+        if self.udp: self.udp.close()
         pygame.quit()
 
 def main():
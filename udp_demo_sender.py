@@ -9,6 +9,12 @@ import argparse
 import socket
 import random
 
+try:
+    from orjson import dumps as json_dumps
+except ImportError:  # orjson is optional
+    def json_dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--host", default="127.0.0.1")
@@ -16,30 +22,51 @@ def main():
     args = ap.parse_args()
 
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    # connect once so each send() skips the per-call destination lookup and checks
+    sock.connect((args.host, args.port))
+    # one dict reused every tick; only the changing values are reassigned
+    payload = dict.fromkeys((
+        "speed_kmh", "rpm", "fuel_level", "coolant_temp_c", "oil_temp_c", "oil_pressure_bar",
+        "turbo_bar", "batt_v", "lambda_value", "left_blinker", "right_blinker", "handbrake",
+        "lights_parking", "lights_low", "lights_high",
+    ))
+    payload["lights_parking"] = True
+    payload["lights_low"] = True
     t0 = time.perf_counter()
+    period = 1 / 30  # ~30 Hz
+    next_t = t0
 
     while True:
         t = time.perf_counter() - t0
-        payload = {
-            "speed_kmh": 100 + 60 * (0.5 + 0.5 * math.sin(t*0.6)),
-            "rpm": 1200 + 5000 * (0.5 + 0.5 * math.sin(t*1.1)),
-            "fuel_level": 0.5 + 0.4 * math.sin(t*0.2),
-            "coolant_temp_c": 80 + 10 * math.sin(t*0.3),
-            "oil_temp_c": 95 + 12 * math.sin(t*0.27),
-            "oil_pressure_bar": 2.0 + 2.5 * (0.5 + 0.5 * math.sin(t*0.9)),
-            "turbo_bar": -0.1 + 2.2 * (0.5 + 0.5 * math.sin(t*0.8)),
-            "batt_v": 13.8 + 0.3 * math.sin(t*0.25),
-            "lambda_value": 1.0 + 0.1 * math.sin(t*1.5),
-            "left_blinker": (math.sin(t*5) > 0),
-            "right_blinker": (math.sin(t*5) <= 0),
-            "handbrake": (math.sin(t*0.7) > 0.92),
-            "lights_parking": True,
-            "lights_low": True,
-            "lights_high": (math.sin(t*0.3) > 0.85)
-        }
-        data = json.dumps(payload).encode("utf-8")
-        sock.sendto(data, (args.host, args.port))
-        time.sleep(0.033)  # ~30 Hz
+        payload["speed_kmh"] = 100 + 60 * (0.5 + 0.5 * math.sin(t*0.6))
+        payload["rpm"] = 1200 + 5000 * (0.5 + 0.5 * math.sin(t*1.1))
+        payload["fuel_level"] = 0.5 + 0.4 * math.sin(t*0.2)
+        payload["coolant_temp_c"] = 80 + 10 * math.sin(t*0.3)
+        payload["oil_temp_c"] = 95 + 12 * math.sin(t*0.27)
+        payload["oil_pressure_bar"] = 2.0 + 2.5 * (0.5 + 0.5 * math.sin(t*0.9))
+        payload["turbo_bar"] = -0.1 + 2.2 * (0.5 + 0.5 * math.sin(t*0.8))
+        payload["batt_v"] = 13.8 + 0.3 * math.sin(t*0.25)
+        payload["lambda_value"] = 1.0 + 0.1 * math.sin(t*1.5)
+        blink = math.sin(t*5)
+        payload["left_blinker"] = (blink > 0)
+        payload["right_blinker"] = (blink <= 0)
+        payload["handbrake"] = (math.sin(t*0.7) > 0.92)
+        payload["lights_high"] = (math.sin(t*0.3) > 0.85)
+        try:
+            sock.send(json_dumps(payload))
+        except ConnectionRefusedError:
+            pass  # ICMP port unreachable from an earlier packet: the dashboard isn't listening (yet)
+
+        # sleep against an absolute schedule so timing errors don't accumulate; sleep() can
+        # oversleep by a scheduler tick, so wake a little early and spin for the last ~1 ms
+        next_t += period
+        remaining = next_t - time.perf_counter()
+        if remaining > 0.002:
+            time.sleep(remaining - 0.001)
+        elif remaining < -period:
+            next_t = time.perf_counter()  # fell far behind (e.g. suspended): don't burst to catch up
+        while time.perf_counter() < next_t:
+            pass
 
 if __name__ == "__main__":
     main()